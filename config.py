@@ -1,4 +1,6 @@
 # Global knobs (simulation + logic thresholds)
+from types import MappingProxyType
+
 SCREEN_W, SCREEN_H = 1200, 800
 PIXELS_PER_NM = 25.0        # horizontal scale
 FEET_PER_PIXEL = 10.0       # vertical (for display text only)
@@ -49,37 +51,52 @@ SENSITIVITY_LEVELS = [
 NM_TO_M = 1852.0
 
 
+def _sl_thresholds_row(
+    sl, ta_tau, ra_tau,
+    ta_dmod_nm, ra_dmod_nm,
+    ta_zthr_ft, ra_zthr_ft,
+    ra_alim_ft,
+):
+    # Read-only view: the same mapping is shared by every caller.
+    return MappingProxyType({
+        "sl": sl,
+        "ta_tau": ta_tau,
+        "ra_tau": ra_tau,
+        "ta_dmod_m": ta_dmod_nm * NM_TO_M if ta_dmod_nm is not None else None,
+        "ra_dmod_m": ra_dmod_nm * NM_TO_M if ra_dmod_nm is not None else None,
+        "ta_zthr_ft": ta_zthr_ft,
+        "ra_zthr_ft": ra_zthr_ft,
+        "ra_alim_ft": ra_alim_ft,        # NEW
+    })
+
+
+# SL bands are a step function of altitude, so each band's thresholds are
+# built once here instead of on every lookup.
+_SL_BANDS = tuple(
+    (amin, amax, _sl_thresholds_row(*row))
+    for (amin, amax, *row) in SENSITIVITY_LEVELS
+)
+
+
 def get_sl_thresholds(own_alt_ft: float):
-    for (
-        amin, amax, sl,
-        ta_tau, ra_tau,
-        ta_dmod_nm, ra_dmod_nm,
-        ta_zthr_ft, ra_zthr_ft,
-        ra_alim_ft,                      # NEW
-    ) in SENSITIVITY_LEVELS:
+    for amin, amax, th in _SL_BANDS:
         if amin <= own_alt_ft < amax:
-            return {
-                "sl": sl,
-                "ta_tau": ta_tau,
-                "ra_tau": ra_tau,
-                "ta_dmod_m": ta_dmod_nm * NM_TO_M if ta_dmod_nm is not None else None,
-                "ra_dmod_m": ra_dmod_nm * NM_TO_M if ra_dmod_nm is not None else None,
-                "ta_zthr_ft": ta_zthr_ft,
-                "ra_zthr_ft": ra_zthr_ft,
-                "ra_alim_ft": ra_alim_ft,   # NEW
-            }
+            return th
 
     # Fallback: use legacy fixed thresholds
-    return {
-        "sl": None,
-        "ta_tau": TA_TAU_S,
-        "ra_tau": RA_TAU_S,
-        "ta_dmod_m": TA_HORZ_M,
-        "ra_dmod_m": RA_HORZ_M,
-        "ta_zthr_ft": TA_VERT_FT,
-        "ra_zthr_ft": RA_VERT_FT,
-        "ra_alim_ft": None,                # NEW
-    }
+    return _LEGACY_THRESHOLDS
+
+
+_LEGACY_THRESHOLDS = MappingProxyType({
+    "sl": None,
+    "ta_tau": TA_TAU_S,
+    "ra_tau": RA_TAU_S,
+    "ta_dmod_m": TA_HORZ_M,
+    "ra_dmod_m": RA_HORZ_M,
+    "ta_zthr_ft": TA_VERT_FT,
+    "ra_zthr_ft": RA_VERT_FT,
+    "ra_alim_ft": None,                # NEW
+})
 
 # ---------------------------------------------------------------------
 # Horizontal Miss Distance (HMD) filter for RA:
@@ -32,7 +32,15 @@ def main():
     args = parser.parse_args()
 
     pygame.init()
-    screen = pygame.display.set_mode((config.SCREEN_W, config.SCREEN_H))
+    # vsync makes the display update wait for vblank, so the loop doesn't
+    # redraw faster than the monitor; clock.tick below still caps it where
+    # vsync is unavailable
+    try:
+        screen = pygame.display.set_mode(
+            (config.SCREEN_W, config.SCREEN_H), pygame.SCALED, vsync=1
+        )
+    except pygame.error:
+        screen = pygame.display.set_mode((config.SCREEN_W, config.SCREEN_H))
     pygame.display.set_caption("Simplified TCAS")
     clock = pygame.time.Clock()
     font = pygame.font.SysFont("consolas,menlo,monospace", 16)
@@ -75,6 +83,10 @@ def main():
     callsigns = list(world.ac.keys())
     selected = callsigns[selected_idx] if callsigns else None
 
+    # first frame (and any re-expose) pushes the whole window; after that
+    # only the rects drawn this frame are sent to the display
+    full_redraw = True
+
     running = True
     while running:
         dt = clock.tick(int(1.0 / config.DT)) / 1000.0
@@ -83,6 +95,8 @@ def main():
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 running = False
+            elif e.type == pygame.WINDOWEXPOSED:
+                full_redraw = True
             elif e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_ESCAPE:
                     running = False
@@ -188,11 +202,15 @@ def main():
         world.step(config.DT)
 
         # Render radar + HUD
-        render(screen, font, world.time_s, world.ac)
-        draw_hud(screen, font, world.time_s, world.ac,
-                 selected=selected, manual_override=world.manual_override)
-
-        pygame.display.flip()
+        dirty = render(screen, font, world.time_s, world.ac)
+        dirty.append(draw_hud(screen, font, world.time_s, world.ac,
+                              selected=selected, manual_override=world.manual_override))
+
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty)
 
     if hasattr(world, "close"):
         world.close()
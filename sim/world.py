@@ -4,7 +4,7 @@ import csv
 import os
 import random
 
-from tcas.models import Aircraft, Advisory, AdvisoryType
+from tcas.models import Aircraft, Advisory, AdvisoryType, RA_TYPES
 from tcas.advisory import AdvisoryLogic, apply_command
 from tcas.sensing import Sensing
 from tcas.tracking import Tracking
@@ -261,7 +261,7 @@ class World:
                 kb = b.advisory.kind
 
                 # Only care about RA_* kinds
-                if not (ka.name.startswith("RA_") and kb.name.startswith("RA_")):
+                if not (ka in RA_TYPES and kb in RA_TYPES):
                     continue
 
                 dir_a = ra_vertical_direction(ka)
@@ -1,7 +1,7 @@
 from enum import Enum, auto
 from typing import Dict, List, Tuple
-from .models import Aircraft, Advisory, AdvisoryType
-from .threat import classify_contact, closing_tau_and_dcpA
+from .models import Aircraft, Advisory, AdvisoryType, RA_TYPES
+from .threat import evaluate_contact
 import config
 
 # ============================================================
@@ -29,6 +29,17 @@ NEUTRAL_RAS = {
     AdvisoryType.RA_MAINTAIN,
 }
 
+# Corrective RAs that command the nominal climb / descent rate
+CORRECTIVE_CLIMB_RAS = frozenset({
+    AdvisoryType.RA_CLIMB,
+    AdvisoryType.RA_CROSSING_CLIMB,
+})
+
+CORRECTIVE_DESCEND_RAS = frozenset({
+    AdvisoryType.RA_DESCEND,
+    AdvisoryType.RA_CROSSING_DESCEND,
+})
+
 def ra_vertical_direction(kind: AdvisoryType) -> int:
     """Return +1 (up), -1 (down), or 0 (neutral) for any RA."""
     if kind in UP_RAS:
@@ -96,30 +107,35 @@ class AdvisoryLogic:
         ra_threats: List[dict] = []
         ta_threats: List[dict] = []
 
+        # Per-ownship invariants: looked up once, not once per intruder
+        own_alt_ft = own.alt_ft
+        prev_state = own.advisory.kind
+        th = config.get_sl_thresholds(own_alt_ft)
+
         for cs, (rel_pos, rel_vel, rel_alt, rel_climb_fps) in rels.items():
-            kind, reason = classify_contact(
-                own.alt_ft,
+            kind, (_, tau, d_cpa, _) = evaluate_contact(
+                own_alt_ft,
                 rel_pos,
                 rel_vel,
                 rel_alt,
                 rel_climb_fps,
-                prev_state=own.advisory.kind,
+                prev_state=prev_state,
+                th=th,
             )
-            tau, d_cpa = closing_tau_and_dcpA(rel_pos, rel_vel)
+            if kind in RA_TYPES:
+                threats = ra_threats
+            elif kind == AdvisoryType.TA:
+                threats = ta_threats
+            else:
+                continue
 
-            entry = {
+            threats.append({
                 "cs": cs,
                 "kind": kind,
-                "reason": reason,
                 "tau": tau,
                 "d_cpa": d_cpa,
                 "rel_alt_ft": rel_alt,
-            }
-
-            if kind.name.startswith("RA_"):
-                ra_threats.append(entry)
-            elif kind == AdvisoryType.TA:
-                ta_threats.append(entry)
+            })
 
         # ---------------------------
         # RA aggregation
@@ -188,7 +204,7 @@ def apply_command(own: Aircraft, override_manual: bool = False):
     # 1) Non-TCAS aircraft → ignore RA
     # ---------------------------------------------------------
     if not own.tcas_equipped:
-        if own.advisory.kind.name.startswith("RA_"):
+        if own.advisory.kind in RA_TYPES:
             own.advisory.kind = AdvisoryType.TA
         return
 
@@ -198,11 +214,11 @@ def apply_command(own: Aircraft, override_manual: bool = False):
     k = own.advisory.kind
 
     # -------- Corrective: CLIMB / CROSSING CLIMB
-    if k in (AdvisoryType.RA_CLIMB, AdvisoryType.RA_CROSSING_CLIMB):
+    if k in CORRECTIVE_CLIMB_RAS:
         own.climb_fps = VS_CLIMB_NOMINAL_FPS
 
     # -------- Corrective: DESCEND / CROSSING DESCEND
-    elif k in (AdvisoryType.RA_DESCEND, AdvisoryType.RA_CROSSING_DESCEND):
+    elif k in CORRECTIVE_DESCEND_RAS:
         own.climb_fps = VS_DESC_NOMINAL_FPS
 
     # -------- Strengthen: Increase Climb/Descend
@@ -27,6 +27,9 @@ class AdvisoryType(Enum):
     RA_DO_NOT_DESCEND = auto()
 
 
+# All RA_* advisories, for O(1) "is this an RA?" membership tests.
+RA_TYPES = frozenset(k for k in AdvisoryType if k.name.startswith("RA_"))
+
 
 @dataclass
 class Advisory:
@@ -1,37 +1,168 @@
+from math import hypot
 from typing import Tuple
-from .math_utils import dot, norm
 from . import models as M
 import config
 
 CROSSING_ALT_FT = 250.0
 
+# Outer CLEAR gate (very loose): anything beyond these is never a threat.
+CLEAR_RANGE_M = 1852 * 13  # ~13 NM
+CLEAR_RANGE_M_SQ = CLEAR_RANGE_M * CLEAR_RANGE_M
+CLEAR_TAU_S = 60.0
+CLEAR_ALT_FT = 4000.0
+
+
+def _closing_tau_and_cpa_offset(rel_pos_m: Tuple[float, float],
+                                rel_vel_mps: Tuple[float, float]) -> Tuple[float, float, float]:
+    """tau and the relative (x, y) offset at CPA, without the sqrt."""
+    px, py = rel_pos_m
+    vx, vy = rel_vel_mps
+    v2 = vx * vx + vy * vy
+    if v2 <= 1e-6:
+        return float("inf"), px, py
+    tau = -(px * vx + py * vy) / v2
+    return tau, px + vx * tau, py + vy * tau
+
 
 def closing_tau_and_dcpA(rel_pos_m: Tuple[float, float],
                          rel_vel_mps: Tuple[float, float]) -> Tuple[float, float]:
-    v2 = dot(rel_vel_mps, rel_vel_mps)
-    if v2 <= 1e-6:
-        return float("inf"), norm(rel_pos_m)
-    tau = -dot(rel_pos_m, rel_vel_mps) / v2
-    d_cpa = norm(
-        (
-            rel_pos_m[0] + (rel_vel_mps[0] * tau),
-            rel_pos_m[1] + (rel_vel_mps[1] * tau),
-        )
+    tau, ex, ey = _closing_tau_and_cpa_offset(rel_pos_m, rel_vel_mps)
+    return tau, hypot(ex, ey)
+
+
+# ------------------------------------------------------------------
+# Helper to choose a "base" RA sense from geometry (CLIMB/DESC/CROSS)
+# ------------------------------------------------------------------
+def _base_ra_kind(rel_alt_ft: float) -> M.AdvisoryType:
+    if abs(rel_alt_ft) < CROSSING_ALT_FT:
+        # Treat nearly same-level as crossing RA
+        if rel_alt_ft >= 0:
+            return M.AdvisoryType.RA_CROSSING_DESCEND
+        else:
+            return M.AdvisoryType.RA_CROSSING_CLIMB
+    else:
+        if rel_alt_ft > 0:
+            return M.AdvisoryType.RA_DESCEND
+        elif rel_alt_ft < 0:
+            return M.AdvisoryType.RA_CLIMB
+        else:
+            # Exact same altitude: arbitrarily choose climb
+            return M.AdvisoryType.RA_CLIMB
+
+
+# ------------------------------------------------------------------
+# Helper to choose a *preventive* RA sense from geometry
+# (Do Not Climb / Do Not Descend).
+# ------------------------------------------------------------------
+def _preventive_ra_kind(rel_alt_ft: float) -> M.AdvisoryType:
+    if rel_alt_ft > 0:
+        # Intruder above → unsafe direction is up → "Do Not Climb"
+        return M.AdvisoryType.RA_DO_NOT_CLIMB
+    elif rel_alt_ft < 0:
+        # Intruder below → unsafe direction is down → "Do Not Descend"
+        return M.AdvisoryType.RA_DO_NOT_DESCEND
+    else:
+        # Exactly same altitude: either preventive sense is arguable;
+        # choose Do Not Climb by default.
+        return M.AdvisoryType.RA_DO_NOT_CLIMB
+
+
+# ------------------------------------------------------------------
+# Advisory state transitions.
+#
+# The choice between CLEAR / TA / new RA / refined RA / RA_MAINTAIN only
+# depends on five flags, so it is tabulated once at import time from the
+# reference decision tree below and indexed by a packed 5-bit key.
+# ------------------------------------------------------------------
+_ACT_CLEAR = 0              # no conflict
+_ACT_TA = 1
+_ACT_RA_NEW = 2             # RA onset (corrective or preventive)
+_ACT_RA_REFINE = 3          # already in RA: CLIMB/DESC/CROSS + INCREASE/REDUCE
+_ACT_RA_MAINTAIN = 4        # RA envelope ended but TA still true
+_ACT_CLEAR_INHIBIT = 5      # RA terminated at low altitude / ground
+_ACT_CLEAR_HMD = 6          # RA terminated by HMD filter
+_ACT_CLEAR_RESOLVED = 7     # RA and TA envelopes both ended
+_ACT_CLEAR_GATE = 8         # outside the outer CLEAR gate
+
+_CLEAR_REASONS = {
+    _ACT_CLEAR: "Clear (no conflict)",
+    _ACT_CLEAR_GATE: "Clear (out of range or diverging)",
+    _ACT_CLEAR_INHIBIT: "Clear (RA inhibited at low altitude/ground)",
+    _ACT_CLEAR_HMD: "Clear of conflict (HMD filter)",
+    _ACT_CLEAR_RESOLVED: "Clear of conflict (RA resolved)",
+}
+
+
+def _advisory_action(prev_is_ra: bool, is_ta: bool, base_is_ra: bool,
+                     hmd_allows_ra: bool, inhibit: bool) -> int:
+    """Reference decision tree used to build _ACTION_LUT."""
+    # Low-altitude / ground inhibition for RA
+    if inhibit:
+        base_is_ra = False
+
+    # =========================================================
+    # RA HYSTERESIS: if already in RA_*, keep RA until fully
+    # clear or inhibited, and refine to INCREASE / REDUCE / CROSS.
+    # =========================================================
+    if prev_is_ra:
+        # Immediate termination when entering low-altitude / ground region
+        if inhibit:
+            return _ACT_CLEAR_INHIBIT
+        # Still inside RA envelope and HMD allows RA → refine RA subtype
+        if hmd_allows_ra and base_is_ra:
+            return _ACT_RA_REFINE
+        # HMD says lateral miss distance will be large → end RA early
+        if not hmd_allows_ra:
+            return _ACT_CLEAR_HMD
+        # Not in RA envelope anymore; not in TA envelope either → fully clear
+        if not is_ta:
+            return _ACT_CLEAR_RESOLVED
+        return _ACT_RA_MAINTAIN
+
+    # =========================================================
+    # Normal escalation logic (no previous RA)
+    # CLEAR / TA → TA / RA / CLEAR
+    # =========================================================
+    if base_is_ra and hmd_allows_ra:
+        return _ACT_RA_NEW
+    if is_ta:
+        return _ACT_TA
+    return _ACT_CLEAR
+
+
+_ACTION_LUT = tuple(
+    _advisory_action(
+        bool(key & 0b10000),
+        bool(key & 0b01000),
+        bool(key & 0b00100),
+        bool(key & 0b00010),
+        bool(key & 0b00001),
     )
-    return tau, d_cpa
+    for key in range(32)
+)
 
 
-def classify_contact(
+def evaluate_contact(
     own_alt_ft,
     rel_pos_m,
     rel_vel_mps,
     rel_alt_ft,
     rel_climb_fps,
     prev_state=None,
+    th=None,
 ):
     """
     Classify a single intruder contact into CLEAR / TA / RA_* states.
 
+    Returns ``(kind, params)`` where ``params`` is
+    ``(action, tau, d_cpa, rel_alt_ft)``; the human-readable reason is
+    only built on demand by format_advisory(). ``tau`` / ``d_cpa`` are
+    None when the contact was rejected by the outer CLEAR gate.
+
+    ``th`` may carry the ownship's SL thresholds (as returned by
+    config.get_sl_thresholds) so callers classifying many intruders for
+    the same ownship look them up once.
+
     Includes:
       - TA envelope (tau / DMOD / ZTHR)
       - RA envelope (tau / DMOD / ZTHR / ALIM)
@@ -39,34 +170,49 @@ def classify_contact(
       - Preventive RAs (RA_DO_NOT_CLIMB / RA_DO_NOT_DESCEND)
       - RA hysteresis and RA_MAINTAIN
     """
-    tau, d_cpa = closing_tau_and_dcpA(rel_pos_m, rel_vel_mps)
+    # ---- Outer CLEAR gate (very loose) ----
+    # Cheapest, highest-reject checks first; d_cpa (sqrt) only once the
+    # contact has survived everything else.
+    aalt = abs(rel_alt_ft)
+    if aalt > CLEAR_ALT_FT:
+        return M.AdvisoryType.CLEAR, (_ACT_CLEAR_GATE, None, None, rel_alt_ft)
+
+    # Cheap L-inf prefilter (no sqrt / divide): over the gate horizon the
+    # intruder can close at most |v|*CLEAR_TAU_S along each axis, so if
+    # either axis is still beyond CLEAR_RANGE_M the CPA distance is too.
+    if (
+        abs(rel_pos_m[0]) > CLEAR_RANGE_M + abs(rel_vel_mps[0]) * CLEAR_TAU_S
+        or abs(rel_pos_m[1]) > CLEAR_RANGE_M + abs(rel_vel_mps[1]) * CLEAR_TAU_S
+    ):
+        return M.AdvisoryType.CLEAR, (_ACT_CLEAR_GATE, None, None, rel_alt_ft)
+
+    tau, ex, ey = _closing_tau_and_cpa_offset(rel_pos_m, rel_vel_mps)
+    if (
+        tau < 0.0
+        or tau > CLEAR_TAU_S
+        or ex * ex + ey * ey > CLEAR_RANGE_M_SQ
+    ):
+        return M.AdvisoryType.CLEAR, (_ACT_CLEAR_GATE, None, None, rel_alt_ft)
+    d_cpa = hypot(ex, ey)
 
     # Relative vertical speed
     rel_vs_fps = rel_climb_fps              # ft/s
     rel_vs_fpm = rel_vs_fps * 60.0          # ft/min
+    avs_fpm = abs(rel_vs_fpm)
 
-    if abs(rel_vs_fpm) > 1e-3:
+    if avs_fpm > 1e-3:
         # vertical tau in seconds: |Δh| / |v_rel| (ft / (ft/min)) * 60
-        vert_tau = abs(rel_alt_ft) / abs(rel_vs_fpm) * 60.0
+        vert_tau = aalt / avs_fpm * 60.0
     else:
         vert_tau = float("inf")
 
-    # ---- Outer CLEAR gate (very loose) ----
-    CLEAR_RANGE_M = 1852 * 13  # ~13 NM
-    if (
-        d_cpa > CLEAR_RANGE_M
-        or tau > 60.0
-        or abs(rel_alt_ft) > 4000.0
-        or tau < 0.0
-    ):
-        return (M.AdvisoryType.CLEAR, "Clear (out of range or diverging)")
-
     # ---- Low-altitude / ground flags ----
     ground = own_alt_ft <= config.GROUND_ALT_FT
     low_alt_total_inhibit = own_alt_ft <= config.RA_TOTAL_INHIBIT_ALT_FT
 
     # ---- Sensitivity Level thresholds (tau / DMOD / ZTHR / ALIM) ----
-    th = config.get_sl_thresholds(own_alt_ft)
+    if th is None:
+        th = config.get_sl_thresholds(own_alt_ft)
     ta_tau = th["ta_tau"]
     ra_tau = th["ra_tau"]
     ta_dmod = th["ta_dmod_m"]
@@ -81,7 +227,7 @@ def classify_contact(
     )
 
     vert_ok_ta = (ta_tau is not None and vert_tau <= ta_tau) or (
-        abs(rel_alt_ft) <= ta_zthr
+        aalt <= ta_zthr
     )
 
     is_ta = range_ok_ta and vert_ok_ta
@@ -105,7 +251,7 @@ def classify_contact(
 
         vert_ok_ra = (
             (vert_tau <= ra_tau)
-            or (abs(rel_alt_ft) <= ra_zthr)
+            or (aalt <= ra_zthr)
             or alim_violation
         )
 
@@ -113,142 +259,108 @@ def classify_contact(
     else:
         base_is_ra = False  # RA inhibited at this SL
 
-    # ---- Low-altitude / ground inhibition for RA ----
-    if low_alt_total_inhibit or ground:
-        base_is_ra = False
-
     # ---- Horizontal Miss Distance (HMD) filter ----
     hmd_allows_ra = d_cpa <= config.HMD_RA_M
 
-    is_ra = base_is_ra and hmd_allows_ra
-
     # Helper: are we currently in ANY RA?
-    prev_is_ra = isinstance(prev_state, M.AdvisoryType) and prev_state.name.startswith(
-        "RA_"
-    )
+    prev_is_ra = prev_state in M.RA_TYPES
+
+    # ---- State transition (see _advisory_action for the decision tree) ----
+    action = _ACTION_LUT[
+        (prev_is_ra << 4)
+        | (is_ta << 3)
+        | (base_is_ra << 2)
+        | (hmd_allows_ra << 1)
+        | (low_alt_total_inhibit or ground)
+    ]
+
+    if action == _ACT_RA_REFINE:
+        kind = _base_ra_kind(rel_alt_ft)
+
+        # Strengthen / weaken based on tau w.r.t. RA threshold
+        if ra_tau is not None:
+            if tau < ra_tau / 2.0:
+                # More urgent: Increase RA
+                if "DESCEND" in kind.name:
+                    kind = M.AdvisoryType.RA_INCREASE_DESCEND
+                else:
+                    kind = M.AdvisoryType.RA_INCREASE_CLIMB
+            elif tau > ra_tau * 1.2:
+                # Improving but still in RA envelope: Reduce RA
+                if "DESCEND" in kind.name:
+                    kind = M.AdvisoryType.RA_REDUCE_DESCEND
+                else:
+                    kind = M.AdvisoryType.RA_REDUCE_CLIMB
+
+        return kind, (action, tau, d_cpa, rel_alt_ft)
+
+    if action == _ACT_RA_NEW:
+        # Decide whether this is a "mild" RA case where a preventive
+        # RA (Do Not Climb / Do Not Descend) is sufficient.
+        # Heuristic: tau fairly close to RA threshold (0.8–1.2 × ra_tau)
+        # and vertical separation still moderately large (≥ 0.4 × ZTHR)
+        # → inside RA envelope but not yet very urgent → preventive RA.
+        use_preventive = (
+            ra_tau is not None
+            and ra_zthr is not None
+            and ra_tau > 0
+            and ra_zthr > 0
+            and 0.8 * ra_tau <= tau <= 1.2 * ra_tau
+            and aalt >= 0.4 * ra_zthr
+        )
 
-    # ------------------------------------------------------------------
-    # Helper to choose a "base" RA sense from geometry (CLIMB/DESC/CROSS)
-    # ------------------------------------------------------------------
-    def base_ra_kind() -> M.AdvisoryType:
-        if abs(rel_alt_ft) < CROSSING_ALT_FT:
-            # Treat nearly same-level as crossing RA
-            if rel_alt_ft >= 0:
-                return M.AdvisoryType.RA_CROSSING_DESCEND
-            else:
-                return M.AdvisoryType.RA_CROSSING_CLIMB
-        else:
-            if rel_alt_ft > 0:
-                return M.AdvisoryType.RA_DESCEND
-            elif rel_alt_ft < 0:
-                return M.AdvisoryType.RA_CLIMB
-            else:
-                # Exact same altitude: arbitrarily choose climb
-                return M.AdvisoryType.RA_CLIMB
-
-    # ------------------------------------------------------------------
-    # Helper to choose a *preventive* RA sense from geometry
-    # (Do Not Climb / Do Not Descend).
-    # ------------------------------------------------------------------
-    def preventive_ra_kind() -> M.AdvisoryType:
-        if rel_alt_ft > 0:
-            # Intruder above → unsafe direction is up → "Do Not Climb"
-            return M.AdvisoryType.RA_DO_NOT_CLIMB
-        elif rel_alt_ft < 0:
-            # Intruder below → unsafe direction is down → "Do Not Descend"
-            return M.AdvisoryType.RA_DO_NOT_DESCEND
+        if use_preventive:
+            kind = _preventive_ra_kind(rel_alt_ft)
         else:
-            # Exactly same altitude: either preventive sense is arguable;
-            # choose Do Not Climb by default.
-            return M.AdvisoryType.RA_DO_NOT_CLIMB
-
-    # =========================================================
-    # RA HYSTERESIS: if already in RA_*, keep RA until fully
-    # clear or inhibited, and refine to INCREASE / REDUCE / CROSS.
-    # =========================================================
-    if prev_is_ra:
-        # Immediate termination when entering low-altitude / ground region
-        if low_alt_total_inhibit or ground:
-            return (
-                M.AdvisoryType.CLEAR,
-                "Clear (RA inhibited at low altitude/ground)",
-            )
-
-        # Still inside RA envelope and HMD allows RA → refine RA subtype
-        if hmd_allows_ra and base_is_ra:
-            kind = base_ra_kind()
-
-            # Strengthen / weaken based on tau w.r.t. RA threshold
-            if ra_tau is not None:
-                if tau < ra_tau / 2.0:
-                    # More urgent: Increase RA
-                    if "DESCEND" in kind.name:
-                        kind = M.AdvisoryType.RA_INCREASE_DESCEND
-                    else:
-                        kind = M.AdvisoryType.RA_INCREASE_CLIMB
-                elif tau > ra_tau * 1.2:
-                    # Improving but still in RA envelope: Reduce RA
-                    if "DESCEND" in kind.name:
-                        kind = M.AdvisoryType.RA_REDUCE_DESCEND
-                    else:
-                        kind = M.AdvisoryType.RA_REDUCE_CLIMB
-
-            return (
-                kind,
-                f"{kind.name} (τ={tau:.1f}s d_cpa={d_cpa:.0f} m Δalt={rel_alt_ft:.0f} ft)",
-            )
-
-        # HMD says lateral miss distance will be large → end RA early
-        if not hmd_allows_ra:
-            return (M.AdvisoryType.CLEAR, "Clear of conflict (HMD filter)")
-
-        # At this point: we are NOT in RA envelope anymore (base_is_ra == False)
+            kind = _base_ra_kind(rel_alt_ft)
 
-        # Case 1: also not in TA envelope → fully clear
-        if not is_ta:
-            return (M.AdvisoryType.CLEAR, "Clear of conflict (RA resolved)")
+        return kind, (action, tau, d_cpa, rel_alt_ft)
 
-        # Case 2: TA still true, but RA envelope ended → issue RA_MAINTAIN
+    if action == _ACT_RA_MAINTAIN:
+        # TA still true, but RA envelope ended → issue RA_MAINTAIN
         # This is where "Maintain vertical speed, maintain" / "maintain altitude"
         # should happen.
-        return (
-            M.AdvisoryType.RA_MAINTAIN,
-            f"RA_MAINTAIN (TA only; hold VS, τ={tau:.1f}s d_cpa={d_cpa:.0f} m Δalt={rel_alt_ft:.0f} ft)",
-        )
+        return M.AdvisoryType.RA_MAINTAIN, (action, tau, d_cpa, rel_alt_ft)
 
-    # =========================================================
-    # Normal escalation logic (no previous RA)
-    # CLEAR / TA → TA / RA / CLEAR
-    # =========================================================
+    if action == _ACT_TA:
+        return M.AdvisoryType.TA, (action, tau, d_cpa, rel_alt_ft)
 
-    if is_ra:
-        # Decide whether this is a "mild" RA case where a preventive
-        # RA (Do Not Climb / Do Not Descend) is sufficient.
-        use_preventive = False
-        if ra_tau is not None and ra_zthr is not None:
-            # Heuristic: tau fairly close to RA threshold and vertical
-            # separation still moderately large → preventive RA.
-            tau_ratio = tau / ra_tau if ra_tau > 0 else 0.0
-            alt_ratio = abs(rel_alt_ft) / ra_zthr if ra_zthr > 0 else 0.0
+    return M.AdvisoryType.CLEAR, (action, tau, d_cpa, rel_alt_ft)
 
-            # Example: inside RA envelope but not yet very urgent
-            if 0.8 <= tau_ratio <= 1.2 and alt_ratio >= 0.4:
-                use_preventive = True
 
-        if use_preventive:
-            kind = preventive_ra_kind()
-        else:
-            kind = base_ra_kind()
+def format_advisory(kind: M.AdvisoryType, params) -> Tuple[M.AdvisoryType, str]:
+    """Build the ``(kind, reason)`` pair for a result of evaluate_contact()."""
+    action, tau, d_cpa, rel_alt_ft = params
+    if action in _CLEAR_REASONS:
+        return kind, _CLEAR_REASONS[action]
 
-        return (
-            kind,
-            f"{kind.name} (τ={tau:.1f}s d_cpa={d_cpa:.0f} m Δalt={rel_alt_ft:.0f} ft)",
-        )
+    geometry = f"τ={tau:.1f}s d_cpa={d_cpa:.0f} m Δalt={rel_alt_ft:.0f} ft"
+    if action == _ACT_RA_MAINTAIN:
+        return kind, f"RA_MAINTAIN (TA only; hold VS, {geometry})"
+    return kind, f"{kind.name} ({geometry})"
 
-    if is_ta:
-        return (
-            M.AdvisoryType.TA,
-            f"TA (τ={tau:.1f}s d_cpa={d_cpa:.0f} m Δalt={rel_alt_ft:.0f} ft)",
-        )
 
-    return (M.AdvisoryType.CLEAR, "Clear (no conflict)")
+def classify_contact(
+    own_alt_ft,
+    rel_pos_m,
+    rel_vel_mps,
+    rel_alt_ft,
+    rel_climb_fps,
+    prev_state=None,
+    th=None,
+):
+    """
+    Classify a single intruder contact and return ``(kind, reason)``.
+
+    Convenience wrapper over evaluate_contact() + format_advisory() for
+    display / logging / tests; hot loops should call evaluate_contact().
+    """
+    return format_advisory(*evaluate_contact(
+        own_alt_ft,
+        rel_pos_m,
+        rel_vel_mps,
+        rel_alt_ft,
+        rel_climb_fps,
+        prev_state=prev_state,
+        th=th,
+    ))
@@ -0,0 +1,62 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import viz.radar_display as rd
+from tcas.models import AdvisoryType
+
+
+@pytest.fixture
+def stalled_tts(monkeypatch):
+    """TTS queue with no worker draining it; yields the queued phrases."""
+    pygame.font.init()
+    monkeypatch.setattr(rd, "_ensure_tts_worker", lambda: None)
+    monkeypatch.setattr(rd, "_tts_available", True)
+    rd.clear_tts_queue()
+    yield lambda: list(rd.tts_queue.queue)
+    rd.clear_tts_queue()
+
+
+def test_flushed_callout_is_requeued_when_advisory_returns(stalled_tts):
+    # REDUCE_CLIMB queues "Level off"; MAINTAIN flushes it and says nothing;
+    # returning to REDUCE_CLIMB inside the repeat window must queue it again.
+    screen = pygame.Surface((800, 600))
+    radar_rect = pygame.Rect(0, 0, 400, 400)
+    state = rd.AlertBoxState()
+
+    for kind in (
+        AdvisoryType.CLEAR,
+        AdvisoryType.RA_REDUCE_CLIMB,
+        AdvisoryType.RA_MAINTAIN,
+        AdvisoryType.RA_REDUCE_CLIMB,
+    ):
+        rd.draw_alert_box(screen, kind, radar_rect, state)
+
+    assert stalled_tts() == ["Level off, level off"]
+
+
+
+@pytest.mark.parametrize(
+    "prev, curr, phrase",
+    [
+        (None, "TA", "Traffic, traffic"),
+        (None, "RA_MAINTAIN", "Monitor vertical speed"),
+        ("RA_CLIMB", "RA_MAINTAIN", "Maintain vertical speed, maintain"),
+        # basic-descend rule fires before the reversal rule
+        ("RA_CLIMB", "RA_DESCEND", "Descend, descend"),
+        ("RA_DESCEND", "RA_INCREASE_CLIMB", "Increase climb, increase climb"),
+        ("CLEAR", "RA_DO_NOT_DESCEND", "Do not descend, do not descend"),
+        ("RA_DO_NOT_CLIMB", "CLEAR", "Clear of conflict"),
+        # silent transitions
+        ("TA", "TA", None),
+        ("RA_CLIMB", "RA_CLIMB", None),
+        ("RA_REDUCE_CLIMB", "RA_MAINTAIN", None),
+        ("TA", "CLEAR", None),
+    ],
+)
+def test_aural_annunciation_phrases(prev, curr, phrase):
+    assert rd.get_aural_annunciation(prev, curr) == phrase
@@ -3,7 +3,13 @@ import math
 import pytest
 
 import config
-from tcas.threat import closing_tau_and_dcpA, classify_contact
+from tcas.threat import (
+    CLEAR_RANGE_M,
+    closing_tau_and_dcpA,
+    classify_contact,
+    evaluate_contact,
+    format_advisory,
+)
 from tcas.models import AdvisoryType
 from hypothesis import given, strategies as st
 
@@ -75,4 +81,33 @@ def test_classify_contact_property_far_is_clear(rel_x, rel_y, rel_alt):
         rel_alt_ft=rel_alt,
         prev_state=None,
     )
-    assert kind == AdvisoryType.CLEAR
\ No newline at end of file
+    assert kind == AdvisoryType.CLEAR
+
+
+def test_bbox_prefilter_does_not_clear_fast_closing_contact():
+    # Beyond CLEAR_RANGE_M on x today, but closing fast enough to be a
+    # threat well inside the 60 s gate: the prefilter must not reject it.
+    kind, reason = classify_contact(
+        own_alt_ft=10_000.0,
+        rel_pos_m=(CLEAR_RANGE_M + 1_000.0, 0.0),
+        rel_vel_mps=(-600.0, 0.0),
+        rel_alt_ft=0.0,
+        rel_climb_fps=0.0,
+        prev_state=None,
+    )
+    assert kind != AdvisoryType.CLEAR, reason
+
+
+def test_format_advisory_matches_classify_contact():
+    args = dict(
+        own_alt_ft=10_000.0,
+        rel_pos_m=(5_000.0, 0.0),
+        rel_vel_mps=(-250.0, 0.0),
+        rel_alt_ft=0.0,
+        rel_climb_fps=0.0,
+        prev_state=None,
+    )
+    kind, params = evaluate_contact(**args)
+    assert format_advisory(kind, params) == classify_contact(**args)
+    assert "τ=" in format_advisory(kind, params)[1]
+
@@ -1,3 +1,4 @@
+import functools
 import pygame
 import textwrap
 from typing import Dict
@@ -5,89 +6,124 @@ from tcas.models import Aircraft, AdvisoryType
 from tcas.threat import closing_tau_and_dcpA   # <-- relative tau/dCPA
 import config
 from .colors import WHITE, AMBER, RED, GREEN
+from .text_cache import render_text
+
+
+# Static part of the header block (everything below the live status lines)
+_CONTROL_LINES = (
+    "",
+    "Controls:",
+    "[1/2/3]  Load scenario",
+    "[SPACE]  Pause / Resume",
+    "[R]      Reload scenario",
+    "[TAB]    Select aircraft",
+    "[M]      Toggle manual mode",
+    "[O]      Toggle override",
+    "[UP/DOWN] Adjust climb/descent",
+    "[C]      Clear manual command",
+    "",
+    "Advisories:",
+)
+
+@functools.lru_cache(maxsize=1024)
+def _wrap(text: str, width: int):
+    """textwrap.wrap(), memoised; advisory lines only change with state."""
+    return tuple(textwrap.wrap(text, width=width))
+
+
+# Advisory line color per advisory kind (anything else → WHITE)
+_ADVISORY_COLOR = {
+    AdvisoryType.RA_CLIMB: RED,
+    AdvisoryType.RA_DESCEND: RED,
+    AdvisoryType.RA_MAINTAIN: RED,
+    AdvisoryType.RA_CROSSING_CLIMB: RED,
+    AdvisoryType.RA_CROSSING_DESCEND: RED,
+    AdvisoryType.RA_INCREASE_CLIMB: RED,
+    AdvisoryType.RA_INCREASE_DESCEND: RED,
+    AdvisoryType.RA_REDUCE_CLIMB: RED,
+    AdvisoryType.RA_REDUCE_DESCEND: RED,
+    AdvisoryType.TA: AMBER,
+    AdvisoryType.CLEAR: GREEN,
+}
+
+
+# Translucent panel background (+ border line), keyed by (panel_w, screen_h)
+_hud_bg_cache = {}
+
+
+def _hud_background(panel_w: int, screen_h: int):
+    key = (panel_w, screen_h)
+    surf = _hud_bg_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((panel_w, screen_h), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 180))
+        # border line separating radar and HUD
+        pygame.draw.line(surf, (120, 120, 120), (0, 0), (0, screen_h), 1)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        _hud_bg_cache[key] = surf
+    return surf
 
 
 def draw_hud(screen, font, t: float, aircraft: Dict[str, Aircraft],
-             selected: str = None, manual_override: bool = False):
-    """Side HUD panel showing controls, advisories, and ownship altitude."""
+             selected: str = None, manual_override: bool = False,
+             own: Aircraft = None):
+    """
+    Side HUD panel showing controls, advisories, and ownship altitude.
+
+    ``own`` defaults to the first aircraft in ``aircraft``. Returns the
+    panel rect.
+    """
     screen_w, screen_h = screen.get_size()
     panel_w = int(screen_w * 0.30)
     panel_x = screen_w - panel_w
     margin_x, margin_y = 12, 10
+    text_x = panel_x + margin_x   # text is drawn straight onto the screen
     line_spacing = 20
 
     # translucent panel
-    hud_surface = pygame.Surface((panel_w, screen_h), pygame.SRCALPHA)
-    hud_surface.fill((0, 0, 0, 180))
+    panel_rect = screen.blit(_hud_background(panel_w, screen_h), (panel_x, 0))
     y = margin_y
 
-    own = list(aircraft.values())[0] if aircraft else None
+    if own is None:
+        own = next(iter(aircraft.values()), None)
+    own_cs = own.callsign if own is not None else None
 
     # header block
-    header_lines = [
+    header_lines = (
         f"t = {t:6.1f}s",
         f"Selected: {selected or 'None'}",
         f"Manual Override: {'ON' if manual_override else 'OFF'}",
-        "",
-        "Controls:",
-        "[1/2/3]  Load scenario",
-        "[SPACE]  Pause / Resume",
-        "[R]      Reload scenario",
-        "[TAB]    Select aircraft",
-        "[M]      Toggle manual mode",
-        "[O]      Toggle override",
-        "[UP/DOWN] Adjust climb/descent",
-        "[C]      Clear manual command",
-        "",
-        "Advisories:",
-    ]
-
-    for line in header_lines:
-        surf = font.render(line, True, WHITE)
-        hud_surface.blit(surf, (margin_x, y))
+    ) + _CONTROL_LINES
+
+    for i, line in enumerate(header_lines):
+        # only the clock line (first) changes every frame
+        surf = render_text(font, line, WHITE, convert=i > 0)
+        screen.blit(surf, (text_x, y))
         y += line_spacing
 
     # advisory section
     max_text_width = panel_w - 2 * margin_x
+    nm_to_m = config.NM_TO_M
     wrap_chars = max_text_width // 9
 
     for cs, ac in aircraft.items():
         if y > screen_h - line_spacing:
             break
 
-        # Advisory color
-        if ac.advisory.kind in (
-            AdvisoryType.RA_CLIMB, AdvisoryType.RA_DESCEND,
-            AdvisoryType.RA_MAINTAIN,
-            AdvisoryType.RA_CROSSING_CLIMB, AdvisoryType.RA_CROSSING_DESCEND,
-            AdvisoryType.RA_INCREASE_CLIMB, AdvisoryType.RA_INCREASE_DESCEND,
-            AdvisoryType.RA_REDUCE_CLIMB, AdvisoryType.RA_REDUCE_DESCEND,
-        ):
-            color = RED
-        elif ac.advisory.kind == AdvisoryType.TA:
-            color = AMBER
-        elif ac.advisory.kind == AdvisoryType.CLEAR:
-            color = GREEN
-        else:
-            color = WHITE
+        advisory = ac.advisory
+        color = _ADVISORY_COLOR.get(advisory.kind, WHITE)
 
         marker = ">" if cs == selected else " "
 
         # --- Relative metrics vs ownship (for intruders) ---
         rel_info = ""
-        if own is not None and cs != own.callsign:
-            dx = ac.pos_m[0] - own.pos_m[0]
-            dy = ac.pos_m[1] - own.pos_m[1]
-            rel_pos = (dx, dy)
-
+        if own is not None and cs != own_cs:
+            rel_pos = (ac.pos_m[0] - own.pos_m[0], ac.pos_m[1] - own.pos_m[1])
+            rel_vel = (ac.vel_mps[0] - own.vel_mps[0], ac.vel_mps[1] - own.vel_mps[1])
             rel_alt_ft = ac.alt_ft - own.alt_ft
-            rel_vel = (
-                ac.vel_mps[0] - own.vel_mps[0],
-                ac.vel_mps[1] - own.vel_mps[1],
-            )
-
             tau, d_cpa_m = closing_tau_and_dcpA(rel_pos, rel_vel)
-            d_cpa_nm = d_cpa_m / config.NM_TO_M
+            d_cpa_nm = d_cpa_m / nm_to_m
 
             rel_info = (
                 f" Δalt={rel_alt_ft:+.0f} ft"
@@ -97,7 +133,7 @@ def draw_hud(screen, font, t: float, aircraft: Dict[str, Aircraft],
 
         # --- Altitude text (sensed + true via bias) ---
         sensed_alt = ac.alt_ft
-        alt_bias = getattr(ac, "alt_bias_ft", 0.0)
+        alt_bias = ac.alt_bias_ft
         true_alt = sensed_alt - alt_bias
 
         if abs(alt_bias) > 1.0:
@@ -108,7 +144,7 @@ def draw_hud(screen, font, t: float, aircraft: Dict[str, Aircraft],
         # --- Vertical speed text (sensed + true via bias) ---
         sensed_vs_fps = ac.climb_fps
         sensed_vs_fpm = sensed_vs_fps * 60.0
-        vs_bias = getattr(ac, "climb_bias_fps", 0.0)
+        vs_bias = ac.climb_bias_fps
         true_vs_fps = sensed_vs_fps - vs_bias
         true_vs_fpm = true_vs_fps * 60.0
 
@@ -118,26 +154,29 @@ def draw_hud(screen, font, t: float, aircraft: Dict[str, Aircraft],
             vs_text = f"VS={sensed_vs_fpm:.0f} fpm"
 
         base_text = (
-            f"{marker}{cs}: {ac.advisory.kind.name}  "
-            f"{ac.advisory.reason}  "
+            f"{marker}{cs}: {advisory.kind.name}  "
+            f"{advisory.reason}  "
             f"{alt_text}  {vs_text}"
             f"{rel_info}  "
             f"mode={ac.control_mode} cmd={ac.manual_cmd or '-'}"
         )
 
-        wrapped = textwrap.wrap(base_text, width=wrap_chars)
+        if len(base_text) <= wrap_chars:
+            wrapped = (base_text,)
+        else:
+            wrapped = _wrap(base_text, wrap_chars)
         for wline in wrapped:
             if y > screen_h - 2 * line_spacing:
                 break
-            surf = font.render(wline, True, color)
-            hud_surface.blit(surf, (margin_x, y))
+            surf = render_text(font, wline, color)
+            screen.blit(surf, (text_x, y))
             y += line_spacing
         y += 4
 
     # ownship altitude at bottom right corner
-    if aircraft and own is not None:
+    if own is not None:
         own_sensed_alt = own.alt_ft
-        own_alt_bias = getattr(own, "alt_bias_ft", 0.0)
+        own_alt_bias = own.alt_bias_ft
         own_true_alt = own_sensed_alt - own_alt_bias
 
         if abs(own_alt_bias) > 1.0:
@@ -148,9 +187,7 @@ def draw_hud(screen, font, t: float, aircraft: Dict[str, Aircraft],
         else:
             alt_text = f"Own Altitude: {own_sensed_alt:,.0f} ft"
 
-        surf = font.render(alt_text, True, WHITE)
-        hud_surface.blit(surf, (margin_x, screen_h - 2 * line_spacing))
+        surf = render_text(font, alt_text, WHITE)
+        screen.blit(surf, (text_x, screen_h - 2 * line_spacing))
 
-    # border line separating radar and HUD
-    pygame.draw.line(hud_surface, (120, 120, 120), (0, 0), (0, screen_h), 1)
-    screen.blit(hud_surface, (panel_x, 0))
+    return panel_rect
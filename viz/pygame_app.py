@@ -5,35 +5,44 @@ from tcas.models import Aircraft, AdvisoryType
 from .colors import WHITE, CYAN, AMBER, RED, GREY
 from .hud import draw_hud
 from .radar_display import draw_radar
+from .text_cache import render_text
+
+# Screen transform constants (window size is fixed by config)
+_PX_PER_M = config.PIXELS_PER_NM / 1852.0
+_CX = config.SCREEN_W * 0.5
+_CY = config.SCREEN_H * 0.5
 
 def world_to_screen(x_m: float, y_m: float) -> Tuple[int,int]:
     # Center origin; +x to right, +y up -> screen y inverted
-    sx = int(config.SCREEN_W/2 + x_m / (1852.0/config.PIXELS_PER_NM))
-    sy = int(config.SCREEN_H/2 - y_m / (1852.0/config.PIXELS_PER_NM))
-    return sx, sy
+    return int(_CX + x_m * _PX_PER_M), int(_CY - y_m * _PX_PER_M)
 
 def draw_aircraft(screen, font, ac: Aircraft):
     x, y = world_to_screen(*ac.pos_m)
     pygame.draw.circle(screen, ac.color, (x, y), 6)
-    call = font.render(ac.callsign, True, WHITE)
+    call = render_text(font, ac.callsign, WHITE, convert=True)
     screen.blit(call, (x+8, y-8))
-    alt = font.render(f"{ac.alt_ft:.0f} ft", True, GREY)
+    alt = render_text(font, f"{ac.alt_ft:.0f} ft", GREY)
     screen.blit(alt, (x+8, y+6))
 
+# Advisory ring color per advisory kind; kinds not listed get no ring.
+_RING_COLOR = {
+    AdvisoryType.TA: AMBER,
+    AdvisoryType.RA_CLIMB: RED,
+    AdvisoryType.RA_DESCEND: RED,
+    AdvisoryType.RA_MAINTAIN: RED,
+}
+
 def draw_advisory_ring(screen, ac: Aircraft):
-    x, y = world_to_screen(*ac.pos_m)
-    kind = ac.advisory.kind
-    if kind == AdvisoryType.TA:
-        color = AMBER
-    elif kind in (AdvisoryType.RA_CLIMB, AdvisoryType.RA_DESCEND, AdvisoryType.RA_MAINTAIN):
-        color = RED
-    else:
+    color = _RING_COLOR.get(ac.advisory.kind)
+    if color is None:
         return
+    x, y = world_to_screen(*ac.pos_m)
     pygame.draw.circle(screen, color, (x, y), 36, 2)
 
 def render(screen, font, time_s, aircraft):
+    """Draw the radar view; returns the list of dirty screen rects."""
     # find ownship (first aircraft)
-    if not aircraft: return
-    own = list(aircraft.values())[0]
+    if not aircraft: return []
+    own = next(iter(aircraft.values()))
     traffic = aircraft
-    draw_radar(screen, font, own, traffic)
+    return draw_radar(screen, font, own, traffic)
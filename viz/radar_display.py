@@ -1,18 +1,57 @@
-import pygame, math, time
+import pygame, math
+import pygame.gfxdraw
 import config
-from tcas.models import Aircraft, AdvisoryType
+from tcas.models import Aircraft, AdvisoryType, RA_TYPES
 from .colors import WHITE, AMBER, RED, CYAN, GREEN
+from .text_cache import render_text
 import threading
 import queue
+from dataclasses import dataclass
 
-# Flash control state
-flash_state = False
-last_flash_time = 0
-last_advisory = None
-last_speech_time = 0
-last_loop_time = 0  # for repeating callouts
 
-tts_queue = queue.Queue()
+@dataclass
+class AlertBoxState:
+    """
+    Flash / aural state carried between frames by one alert box; times
+    are pygame ticks (ms).
+    """
+    flash_state: bool = False
+    last_flash_time: int = 0
+    last_advisory: str | None = None
+    last_speech_time: int = 0
+    last_loop_time: int = 0  # for repeating callouts
+
+
+# State of the main radar's alert box
+_alert_state = AlertBoxState()
+
+# Alert box font, created on first use (needs pygame.font initialised)
+_alert_font = None
+
+
+def _get_alert_font():
+    global _alert_font
+    if _alert_font is None:
+        _alert_font = pygame.font.Font(None, 44)
+    return _alert_font
+
+
+# Speech: one worker thread owns the pyttsx3 engine and drains tts_queue.
+# draw_alert_box flushes the queue before each enqueue, so it holds at most
+# one phrase today; maxsize (drop-oldest when full) is only a defensive
+# bound for any future caller that enqueues without flushing.
+tts_queue = queue.Queue(maxsize=4)
+_tts_thread = None
+_tts_available = True
+
+# Radar projection: screen pixels per metre, and the display range (12 NM)
+PX_PER_M = config.PIXELS_PER_NM / 1852.0
+MAX_RANGE_M = 1852.0 * 12
+
+# (sin, cos) of the heading ticks, every 30 degrees
+_TICK_TRIG = tuple(
+    (math.sin(math.radians(d)), math.cos(math.radians(d))) for d in range(0, 360, 30)
+)
 
 def clear_tts_queue():
     """Remove any pending TTS items so we don't play stale advisories."""
@@ -24,19 +63,17 @@ def clear_tts_queue():
         pass
 
 
-def get_aural_annunciation(prev: str | None, curr: str) -> str | None:
+_RA_STATES = frozenset(n for n in AdvisoryType.__members__ if n.startswith("RA_"))
+
+
+def _aural_rule(prev: str, curr: str) -> str | None:
     """
     Map advisory transitions to TCAS II v7.1–style aural annunciations,
-    using explicit RA subtypes.
+    using explicit RA subtypes. Reference rules for _AURAL_TABLE; ``prev``
+    is "NONE" before the first advisory.
     """
-    if prev is None:
-        prev = "NONE"
-
-    prev = prev.upper()
-    curr = curr.upper()
+    ra_states = _RA_STATES
 
-    ra_states = {n for n in AdvisoryType.__members__ if n.startswith("RA_")}
-    
     # --- Traffic Advisory ---
     if curr == "TA" and prev != "TA":
         return "Traffic, traffic"
@@ -99,6 +136,23 @@ def get_aural_annunciation(prev: str | None, curr: str) -> str | None:
 
     return None
 
+
+# (prev, curr) advisory names → phrase, for every transition that speaks
+_AURAL_TABLE = {
+    (prev, curr): phrase
+    for prev in ("NONE", *AdvisoryType.__members__)
+    for curr in AdvisoryType.__members__
+    if (phrase := _aural_rule(prev, curr)) is not None
+}
+
+
+def get_aural_annunciation(prev: str | None, curr: str) -> str | None:
+    """
+    Aural annunciation for an advisory transition, by AdvisoryType name
+    (``prev`` is None before the first advisory); None if silent.
+    """
+    return _AURAL_TABLE.get((prev or "NONE", curr))
+
 def get_state_loop_phrase(prev: str | None, curr: str) -> str | None:
     """
     Phrase to repeat while an advisory remains active.
@@ -141,8 +195,16 @@ def get_state_loop_phrase(prev: str | None, curr: str) -> str | None:
     return base_phrases.get(curr_u)
 
 def tts_worker():
-    import pyttsx3
-    engine = pyttsx3.init()
+    global _tts_available
+    # the engine must be created on the thread that runs it
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+    except Exception:
+        # no TTS backend: stop accepting speech instead of queueing forever
+        _tts_available = False
+        clear_tts_queue()
+        return
     engine.setProperty("rate", 180)
     engine.setProperty("volume", 1.0)
     while True:
@@ -153,38 +215,106 @@ def tts_worker():
         engine.runAndWait()
         tts_queue.task_done()
 
-threading.Thread(target=tts_worker, daemon=True).start()
+
+
+def _ensure_tts_worker():
+    """Start the TTS worker on first use; later calls are no-ops."""
+    global _tts_thread
+    if _tts_thread is None:
+        _tts_thread = threading.Thread(target=tts_worker, daemon=True)
+        _tts_thread.start()
 
 
 def speak_async(text):
-    tts_queue.put(text)
+    if not _tts_available:
+        return
+    _ensure_tts_worker()
+    try:
+        tts_queue.put_nowait(text)
+    except queue.Full:
+        try:
+            tts_queue.get_nowait()
+            tts_queue.task_done()
+        except queue.Empty:
+            pass
+        try:
+            tts_queue.put_nowait(text)
+        except queue.Full:
+            pass
+
 
+def project_intruders(own: Aircraft, traffic, center, radius_px=None):
+    """
+    Project all intruders onto the radar in one pass.
 
-def draw_intruder(screen, font, own: Aircraft, intr: Aircraft, center):
+    Returns ``[(intr, x, y, diff_ft), ...]`` for the intruders within
+    display range (12 NM, and inside the ``radius_px`` disc if given):
+    screen coordinates plus sensed altitude relative to ownship. The rest
+    are dropped here so draw_intruder only sees what is actually drawn.
+    """
     cx, cy = center
-    dx = intr.pos_m[0] - own.pos_m[0]
-    dy = intr.pos_m[1] - own.pos_m[1]
-    distance_m = math.hypot(dx, dy)
-    max_range_m = 1852 * 12  # 12 NM in metres
-    if distance_m > max_range_m:
-        return
+    own_cs = own.callsign
+    ox, oy = own.pos_m
+    own_alt = own.alt_ft
 
-    # convert to screen coordinates relative to radar center
-    x = cx + dx / (1852 / config.PIXELS_PER_NM)
-    y = cy - dy / (1852 / config.PIXELS_PER_NM)
+    # on a small window the disc, not 12 NM, is the binding limit
+    range_m = MAX_RANGE_M
+    if radius_px is not None:
+        range_m = min(range_m, radius_px / PX_PER_M)
+    range_m_sq = range_m * range_m
 
+    projected = []
+    for intr in traffic.values():
+        if intr.callsign == own_cs:
+            continue
+        dx = intr.pos_m[0] - ox
+        dy = intr.pos_m[1] - oy
+        # cheap box reject first, then the exact (squared) range test
+        if abs(dx) > range_m or abs(dy) > range_m:
+            continue
+        if dx * dx + dy * dy > range_m_sq:
+            continue
+        # convert to screen coordinates relative to radar center
+        projected.append(
+            (intr, cx + dx * PX_PER_M, cy - dy * PX_PER_M, intr.alt_ft - own_alt)
+        )
+    return projected
+
+
+def _make_symbol(draw):
+    surf = pygame.Surface((2 * _SYM_C + 1, 2 * _SYM_C + 1), pygame.SRCALPHA)
+    draw(surf)
+    return surf
+
+
+# Intruder symbols (size 8) pre-rendered around (_SYM_C, _SYM_C); the
+# extra pixel of margin holds the outline diamond's 2 px stroke.
+_SYM_C = 9
+_SYM_DIAMOND = [(_SYM_C, _SYM_C - 8), (_SYM_C + 8, _SYM_C),
+                (_SYM_C, _SYM_C + 8), (_SYM_C - 8, _SYM_C)]
+_SYM_RA = _make_symbol(lambda s: pygame.draw.rect(s, RED, pygame.Rect(_SYM_C - 8, _SYM_C - 8, 16, 16)))
+_SYM_TA = _make_symbol(lambda s: pygame.draw.circle(s, AMBER, (_SYM_C, _SYM_C), 8))
+_SYM_PROX = _make_symbol(lambda s: pygame.draw.polygon(s, WHITE, _SYM_DIAMOND))
+_SYM_OTHER = _make_symbol(lambda s: pygame.draw.polygon(s, WHITE, _SYM_DIAMOND, 2))
+
+
+def draw_intruder(screen, font, intr: Aircraft, x, y, diff_sensed,
+                  own_true_alt, own_alt_bias):
+    """
+    Draw one intruder symbol and tag at its projected screen position;
+    ``diff_sensed`` is its sensed altitude relative to ownship (ft), and
+    ``own_true_alt`` / ``own_alt_bias`` are ownship's, hoisted by the
+    caller. Returns the screen area touched.
+    """
     # --- Relative altitude (sensed + true via bias) and VS arrows ---
-    diff_sensed = intr.alt_ft - own.alt_ft
     tag = ""
     if abs(diff_sensed) <= 1200:
         # sensed rel alt in hundreds
         hundreds = int(diff_sensed / 100)
 
         # true relative altitude using biases
-        intr_alt_bias = getattr(intr, "alt_bias_ft", 0.0)
-        own_alt_bias = getattr(own, "alt_bias_ft", 0.0)
+        intr_alt_bias = intr.alt_bias_ft
         intr_true_alt = intr.alt_ft - intr_alt_bias
-        own_true_alt = own.alt_ft - own_alt_bias
         diff_true = intr_true_alt - own_true_alt
         hundreds_true = int(diff_true / 100)
 
@@ -202,7 +332,7 @@ def draw_intruder(screen, font, own: Aircraft, intr: Aircraft, center):
             arrow_sensed = "↓"
 
         # True VS arrow using bias
-        intr_vs_bias = getattr(intr, "climb_bias_fps", 0.0)
+        intr_vs_bias = intr.climb_bias_fps
         true_vs_fps = intr.climb_fps - intr_vs_bias
         arrow_true = ""
         if abs(intr_vs_bias) > 0.1:
@@ -221,61 +351,62 @@ def draw_intruder(screen, font, own: Aircraft, intr: Aircraft, center):
     # determine advisory type and symbol
     adv = intr.advisory.kind
     proximate = abs(diff_sensed) <= 1200
-    size = 8
     color = WHITE
 
-    if adv in (
-        AdvisoryType.RA_CLIMB, AdvisoryType.RA_DESCEND, AdvisoryType.RA_MAINTAIN,
-        AdvisoryType.RA_CROSSING_CLIMB, AdvisoryType.RA_CROSSING_DESCEND,
-        AdvisoryType.RA_INCREASE_CLIMB, AdvisoryType.RA_INCREASE_DESCEND,
-        AdvisoryType.RA_REDUCE_CLIMB, AdvisoryType.RA_REDUCE_DESCEND,
-        AdvisoryType.RA_DO_NOT_CLIMB, AdvisoryType.RA_DO_NOT_DESCEND,
-    ):
-        pygame.draw.rect(screen, RED, pygame.Rect(x - size, y - size, size * 2, size * 2))
+    if adv in RA_TYPES:
+        sym = _SYM_RA
         color = RED
     elif adv == AdvisoryType.TA:
-        pygame.draw.circle(screen, AMBER, (x, y), size)
+        sym = _SYM_TA
         color = AMBER
     elif proximate:
-        pts = [(x, y - size), (x + size, y), (x, y + size), (x - size, y)]
-        pygame.draw.polygon(screen, WHITE, pts)
+        sym = _SYM_PROX
     else:
-        pts = [(x, y - size), (x + size, y), (x, y + size), (x - size, y)]
-        pygame.draw.polygon(screen, WHITE, pts, 2)
+        sym = _SYM_OTHER
+    dirty = screen.blit(sym, (int(x) - _SYM_C, int(y) - _SYM_C))
 
     # altitude / VS tag (biased + true)
     if tag:
-        text = font.render(tag, True, color)
-        screen.blit(text, (x + 10, y - 8))
-
-def draw_alert_box(screen, advisory_text, radar_rect):
-    """Draw flashing alert box below radar and play TCAS aural on changes only."""
-    global flash_state, last_flash_time, last_advisory, last_speech_time
-    now = time.time()
-    flash_interval = 0.5        # seconds between toggles
-    clear_interval = 2.0        # how long CLEAR flashes once
-
-    # Map advisory kind → short label + color for the box
-    advisories_map = {
-        "CLEAR":               ("CLEAR", GREEN),
-        "TA":                  ("TRAFFIC", AMBER),
-        "RA_CLIMB":            ("CLIMB", RED),
-        "RA_DESCEND":          ("DESCEND", RED),
-        "RA_MAINTAIN":         ("MAINTAIN VS", RED),
-        "RA_INCREASE_CLIMB":   ("INCREASE CLIMB", RED),
-        "RA_INCREASE_DESCEND": ("INCREASE DESCENT", RED),
-        "RA_REDUCE_CLIMB":     ("REDUCE CLIMB", RED),
-        "RA_REDUCE_DESCEND":   ("REDUCE DESCENT", RED),
-        "RA_CROSSING_CLIMB":   ("XING CLIMB", RED),
-        "RA_CROSSING_DESCEND": ("XING DESCENT", RED),
-        "RA_DO_NOT_CLIMB":     ("DO NOT CLIMB", RED),
-        "RA_DO_NOT_DESCEND":   ("DO NOT DESCEND", RED),
-    }
+        text = render_text(font, tag, color, convert=True)
+        dirty = dirty.union(screen.blit(text, (x + 10, y - 8)))
+    return dirty
+
+# Map advisory kind → short label + color for the alert box
+_ADVISORY_MAP = {
+    AdvisoryType.CLEAR:               ("CLEAR", GREEN),
+    AdvisoryType.TA:                  ("TRAFFIC", AMBER),
+    AdvisoryType.RA_CLIMB:            ("CLIMB", RED),
+    AdvisoryType.RA_DESCEND:          ("DESCEND", RED),
+    AdvisoryType.RA_MAINTAIN:         ("MAINTAIN VS", RED),
+    AdvisoryType.RA_INCREASE_CLIMB:   ("INCREASE CLIMB", RED),
+    AdvisoryType.RA_INCREASE_DESCEND: ("INCREASE DESCENT", RED),
+    AdvisoryType.RA_REDUCE_CLIMB:     ("REDUCE CLIMB", RED),
+    AdvisoryType.RA_REDUCE_DESCEND:   ("REDUCE DESCENT", RED),
+    AdvisoryType.RA_CROSSING_CLIMB:   ("XING CLIMB", RED),
+    AdvisoryType.RA_CROSSING_DESCEND: ("XING DESCENT", RED),
+    AdvisoryType.RA_DO_NOT_CLIMB:     ("DO NOT CLIMB", RED),
+    AdvisoryType.RA_DO_NOT_DESCEND:   ("DO NOT DESCEND", RED),
+}
+
+
+def draw_alert_box(screen, kind: AdvisoryType, radar_rect, state: AlertBoxState = None):
+    """
+    Draw flashing alert box below radar and play TCAS aural on changes only.
+
+    ``state`` defaults to the main radar's AlertBoxState. Returns the box
+    rect.
+    """
+    if state is None:
+        state = _alert_state
+    now = pygame.time.get_ticks()
+    flash_interval = 500        # ms between toggles
+    clear_interval = 2000       # ms CLEAR flashes once
 
-    current = advisory_text.upper()
-    display_text, color = advisories_map.get(current, ("CLEAR", WHITE))
+    current = kind.name
+    display_text, color = _ADVISORY_MAP.get(kind, ("CLEAR", WHITE))
 
     # --- Transition-based aural ONLY (no looping) ---
+    last_advisory = state.last_advisory
     if last_advisory != current:
         # Kill any pending old phrases
         clear_tts_queue()
@@ -283,23 +414,23 @@ def draw_alert_box(screen, advisory_text, radar_rect):
         phrase = get_aural_annunciation(last_advisory, current)
         if phrase is not None:
             speak_async(phrase)
-            last_speech_time = now
+            state.last_speech_time = now
 
     # --- Flash control (unchanged) ---
     if current != "CLEAR":
-        if now - last_flash_time > flash_interval:
-            flash_state = not flash_state
-            last_flash_time = now
+        if now - state.last_flash_time > flash_interval:
+            state.flash_state = not state.flash_state
+            state.last_flash_time = now
     else:
         # Only flash once when switching INTO CLEAR
         if last_advisory and last_advisory != "CLEAR":
-            last_flash_time = now
-            flash_state = True
-        if flash_state and (now - last_flash_time) > clear_interval:
-            flash_state = False
+            state.last_flash_time = now
+            state.flash_state = True
+        if state.flash_state and (now - state.last_flash_time) > clear_interval:
+            state.flash_state = False
 
     # Remember current advisory for next frame
-    last_advisory = current
+    state.last_advisory = current
 
     # --- Draw box below radar (unchanged) ---
     screen_w, screen_h = screen.get_size()
@@ -310,66 +441,149 @@ def draw_alert_box(screen, advisory_text, radar_rect):
     if box_y + box_h > screen_h:
         box_y = screen_h - box_h - 10
 
-    rect = pygame.Rect(box_x, box_y, box_w, box_h)
-    box_color = color if flash_state else (40, 40, 40)
+    box_color = color if state.flash_state else (40, 40, 40)
 
-    pygame.draw.rect(screen, box_color, rect, border_radius=10)
+    return screen.blit(
+        _alert_box_surface(display_text, box_color, box_w, box_h), (box_x, box_y)
+    )
 
-    font = pygame.font.Font(None, 44)
-    text = font.render(display_text.upper(), True, (0, 0, 0))
-    text_rect = text.get_rect(center=rect.center)
-    screen.blit(text, text_rect)
 
+# Rendered alert boxes, keyed by (display_text, box_color, box_w, box_h);
+# the rounded corners stay transparent.
+_alert_cache = {}
 
-def draw_radar(screen, font, own: Aircraft, traffic):
-    """Split screen: top for radar, bottom for advisory alert box."""
-    screen_w, screen_h = screen.get_size()
 
-    # Reserve 90% height for radar, 10% for alert
-    radar_h = int(screen_h * 0.90)
-    center_x = int(screen_w * 0.35)
-    center_y = radar_h // 2
-    center = (center_x, center_y)
-    radius = min(center_x, center_y) - 40
+def _alert_box_surface(display_text, box_color, box_w, box_h):
+    key = (display_text, box_color, box_w, box_h)
+    surf = _alert_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        rect = surf.get_rect()
+        pygame.draw.rect(surf, box_color, rect, border_radius=10)
+
+        text = render_text(_get_alert_font(), display_text, (0, 0, 0), convert=True)
+        surf.blit(text, text.get_rect(center=rect.center))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        _alert_cache[key] = surf
+    return surf
+
+
+# Static radar chrome (incl. range label), keyed by (font, center_x,
+# center_y, radius). Each entry covers the radar's bounding square;
+# outside the disc it is transparent.
+_radar_bg_cache = {}
+
+
+def _radar_background(font, center_x, center_y, radius):
+    key = (font, center_x, center_y, radius)
+    surf = _radar_bg_cache.get(key)
+    if surf is not None:
+        return surf
 
-    # radar background
-    pygame.draw.circle(screen, (0, 0, 0), center, radius)
-    pygame.draw.circle(screen, (100, 100, 100), center, radius, 2)
+    size = 2 * radius + 1
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    # draw in the surface's own frame: radar center at (radius, radius)
+    c = radius
+    center = (c, c)
+
+    # radar background (built once, so the rings can afford anti-aliasing)
+    pygame.gfxdraw.filled_circle(surf, c, c, radius, (0, 0, 0))
+    pygame.draw.circle(surf, (100, 100, 100), center, radius, 2)
 
     # range rings
     for i in range(1, 5):
-        pygame.draw.circle(screen, (60, 60, 60), center, int(radius * i / 4), 1)
+        pygame.gfxdraw.aacircle(surf, c, c, int(radius * i / 4), (60, 60, 60))
 
     # heading ticks
-    for deg in range(0, 360, 30):
-        rad = math.radians(deg)
-        r1 = radius - 10
-        r2 = radius
-        x1 = center_x + r1 * math.sin(rad)
-        y1 = center_y - r1 * math.cos(rad)
-        x2 = center_x + r2 * math.sin(rad)
-        y2 = center_y - r2 * math.cos(rad)
-        pygame.draw.line(screen, (100, 100, 100), (x1, y1), (x2, y2), 1)
+    r1 = radius - 10
+    r2 = radius
+    for sin_t, cos_t in _TICK_TRIG:
+        x1 = c + r1 * sin_t
+        y1 = c - r1 * cos_t
+        x2 = c + r2 * sin_t
+        y2 = c - r2 * cos_t
+        pygame.draw.line(surf, (100, 100, 100), (x1, y1), (x2, y2), 1)
 
     # ownship triangle
     pts = [
-        (center_x, center_y - 10),
-        (center_x - 6, center_y + 8),
-        (center_x + 6, center_y + 8),
+        (c, c - 10),
+        (c - 6, c + 8),
+        (c + 6, c + 8),
     ]
-    pygame.draw.polygon(screen, (255, 255, 255), pts)
-
-    # intruders
-    for intr in traffic.values():
-        if intr.callsign == own.callsign:
-            continue
-        draw_intruder(screen, font, own, intr, center)
+    pygame.draw.polygon(surf, (255, 255, 255), pts)
 
     # range label
-    label = font.render("12 NM", True, WHITE)
-    screen.blit(label, (center_x - 20, center_y - radius + 10))
+    surf.blit(font.render("12 NM", True, WHITE), (c - 20, 10))
+
+    # corners outside the disc stay transparent, so keep per-pixel alpha
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    _radar_bg_cache[key] = surf
+    return surf
+
+
+# Everything the radar scope depends on, as of its last redraw
+_last_radar_key = None
+
+
+def _radar_key(screen, font, own: Aircraft, traffic):
+    return (
+        screen, screen.get_size(), font,
+        own.callsign, own.pos_m, own.alt_ft, own.alt_bias_ft,
+        tuple(
+            (a.callsign, a.pos_m, a.alt_ft, a.alt_bias_ft,
+             a.climb_fps, a.climb_bias_fps, a.advisory.kind)
+            for a in traffic.values()
+        ),
+    )
+
+
+def draw_radar(screen, font, own: Aircraft, traffic, alert_state: AlertBoxState = None):
+    """
+    Split screen: top for radar, bottom for advisory alert box.
+
+    The scope is only redrawn when something it shows has changed (e.g.
+    not while paused); nothing else draws over it, so the previous
+    frame's pixels are still valid. The alert box runs every frame for
+    flash timing and aurals.
+
+    Called once per frame; the caller is expected to cap the frame rate
+    (run.py uses vsync plus clock.tick).
+
+    ``alert_state`` is passed through to draw_alert_box. Returns the list
+    of screen rects drawn this frame, for ``pygame.display.update``.
+    """
+    global _last_radar_key
+    screen_w, screen_h = screen.get_size()
+
+    # Reserve 90% height for radar, 10% for alert
+    radar_h = int(screen_h * 0.90)
+    center_x = int(screen_w * 0.35)
+    center_y = radar_h // 2
+    center = (center_x, center_y)
+    radius = min(center_x, center_y) - 40
+
+    dirty = []
+    key = _radar_key(screen, font, own, traffic)
+    if key != _last_radar_key:
+        _last_radar_key = key
+
+        # static radar chrome (disc, rings, ticks, ownship, range label)
+        dirty.append(screen.blit(
+            _radar_background(font, center_x, center_y, radius),
+            (center_x - radius, center_y - radius),
+        ))
+
+        # intruders (ownship values are constant across the pass)
+        own_alt_bias = own.alt_bias_ft
+        own_true_alt = own.alt_ft - own_alt_bias
+        for intr, x, y, diff in project_intruders(own, traffic, center, radius):
+            dirty.append(draw_intruder(screen, font, intr, x, y, diff,
+                                       own_true_alt, own_alt_bias))
 
     # draw alert box in bottom area
-    label_text = own.advisory.kind.name if own.advisory else "CLEAR"
+    kind = own.advisory.kind if own.advisory else AdvisoryType.CLEAR
     radar_rect = pygame.Rect(center_x - radius, center_y - radius, radius * 2, radius * 2)
-    draw_alert_box(screen, label_text, radar_rect)
\ No newline at end of file
+    dirty.append(draw_alert_box(screen, kind, radar_rect, alert_state))
+    return dirty
\ No newline at end of file
@@ -0,0 +1,21 @@
+import functools
+
+import pygame
+
+
+@functools.lru_cache(maxsize=512)
+def render_text(font, text: str, color, convert: bool = False):
+    """
+    Anti-aliased ``font.render(text, True, color)``, memoised per
+    (font, text, color) so unchanged labels are not re-rasterized
+    every frame.
+
+    Pass ``convert=True`` for text that stays the same across many
+    frames: it is converted to the display format (once a window
+    exists) so repeat blits take SDL's fast path. Text that changes
+    every frame skips the extra copy.
+    """
+    surf = font.render(text, True, color)
+    if convert and pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    return surf